@@ -0,0 +1,40 @@
+"""raw_documents_indexes
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-09-01
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Partial index for the "worker picks N unprocessed docs" scan; covers
+    # only the (small) unprocessed subset so it stays cheap to maintain.
+    op.create_index(
+        "ix_raw_documents_unprocessed",
+        "raw_documents",
+        ["scraped_at"],
+        postgresql_where=sa.text("processed = false"),
+    )
+    # Source-scoped analytics / incremental-crawl lookups.
+    op.create_index(
+        "ix_raw_documents_source_name_scraped",
+        "raw_documents",
+        ["source_name", "scraped_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_raw_documents_source_name_scraped", table_name="raw_documents")
+    op.drop_index("ix_raw_documents_unprocessed", table_name="raw_documents")
@@ -0,0 +1,28 @@
+"""server_side_timestamps
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-09-01
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column("raw_documents", "scraped_at", server_default=sa.text("now()"))
+    op.alter_column("scrape_runs", "started_at", server_default=sa.text("now()"))
+
+
+def downgrade() -> None:
+    op.alter_column("scrape_runs", "started_at", server_default=None)
+    op.alter_column("raw_documents", "scraped_at", server_default=None)
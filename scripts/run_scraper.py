@@ -85,6 +85,10 @@ def run_via_prefect() -> None:
 
 
 def main() -> None:
+    from src.scraper.utils import configure_async_logging
+
+    configure_async_logging()
+
     parser = argparse.ArgumentParser(description="Run SovereignLens scrapers")
 
     mode = parser.add_mutually_exclusive_group(required=True)
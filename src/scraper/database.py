@@ -1,18 +1,54 @@
+import csv
+import io
+import json
 import os
 from contextlib import contextmanager
 
 from dotenv import load_dotenv
 from loguru import logger
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import QueuePool
 
-from src.scraper.models import Base
+from src.scraper.models import Base, RawDocument
 
 load_dotenv()
 
-DATABASE_URL = os.environ["POSTGRES_URL"]
 
-engine = create_engine(DATABASE_URL, pool_pre_ping=True)
+def _database_url() -> str:
+    """Resolve the engine URL, preferring the psycopg (v3) driver when installed.
+
+    psycopg3's client-side pipelining and binary protocol cut per-statement
+    round-trips on INSERT-heavy paths; when it isn't available the URL is
+    left alone and SQLAlchemy falls back to psycopg2.
+    """
+    url = os.environ["POSTGRES_URL"]
+    if url.startswith("postgresql://"):
+        try:
+            import psycopg  # noqa: F401
+        except ImportError:
+            return url
+        return url.replace("postgresql://", "postgresql+psycopg://", 1)
+    return url
+
+
+DATABASE_URL = _database_url()
+
+# Sized for concurrent Prefect tasks / Scrapy callbacks each grabbing a
+# session; the SQLAlchemy defaults (5 + 10 overflow) thrash under that load.
+engine = create_engine(
+    DATABASE_URL,
+    poolclass=QueuePool,
+    pool_size=int(os.getenv("DB_POOL_SIZE", "25")),
+    max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "25")),
+    pool_recycle=1800,
+    pool_timeout=30,
+    pool_pre_ping=True,
+    # One multi-VALUES INSERT per 1000 rows instead of driver executemany;
+    # aligned with _INSERT_CHUNK_SIZE below.
+    insertmanyvalues_page_size=1000,
+)
 SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
 
 
@@ -29,6 +65,240 @@ def get_db() -> Session:
         db.close()
 
 
+# Column order used by the COPY fast path; must match raw_documents DDL.
+_RAW_DOCUMENT_COLUMNS = (
+    "id",
+    "source_url",
+    "title",
+    "content",
+    "country",
+    "source_name",
+    "scraped_at",
+    "processed",
+    "metadata",
+)
+
+
+# Rows per INSERT statement; keeps parameter counts bounded on huge runs.
+_INSERT_CHUNK_SIZE = 1000
+
+# Built once at import; RETURNING makes SQLAlchemy take the insertmanyvalues
+# pathway (a single multi-VALUES statement per page) and gives an exact
+# inserted count even when conflicts are skipped.
+_INSERT_STMT = (
+    pg_insert(RawDocument.__table__)
+    .on_conflict_do_nothing(index_elements=["source_url"])
+    .returning(RawDocument.__table__.c.id)
+)
+
+
+def bulk_insert_on_conflict(db: Session, rows: list[dict]) -> int:
+    """Insert raw_documents rows with ``ON CONFLICT (source_url) DO NOTHING``.
+
+    A single statement handles both insert and deduplication inside
+    PostgreSQL — no pre-SELECT round-trip, and no race-window IntegrityError
+    to handle. The statement targets the Table directly and takes plain dict
+    payloads, so no ORM objects (identity map, flush plan, attribute
+    instrumentation) are built per row. Large payloads are executed in slices
+    of ``_INSERT_CHUNK_SIZE`` rows to bound memory and statement size.
+    Returns the number of rows actually inserted. The caller owns the
+    transaction and must commit.
+    """
+    if not rows:
+        return 0
+
+    inserted = 0
+    for start in range(0, len(rows), _INSERT_CHUNK_SIZE):
+        result = db.execute(_INSERT_STMT, rows[start : start + _INSERT_CHUNK_SIZE])
+        inserted += len(result.scalars().all())
+    return inserted
+
+
+# NULL sentinel for the COPY stream; distinct from '' so stored values don't
+# depend on which bulk path a batch took
+_COPY_NULL = "\\N"
+
+
+def bulk_insert_with_copy(db: Session, rows: list[dict]) -> int:
+    """Bulk-insert raw_documents rows via COPY into a TEMP staging table.
+
+    Streams all rows into PostgreSQL in a single COPY, then moves them into
+    raw_documents with one ``INSERT ... ON CONFLICT (source_url) DO NOTHING``,
+    so deduplication and persistence happen in one round-trip instead of a
+    SELECT + INSERT + COMMIT per row. Returns the number of rows actually
+    inserted (duplicates are silently skipped). The caller owns the
+    transaction and must commit.
+    """
+    if not rows:
+        return 0
+
+    buf = io.StringIO()
+    writer = csv.writer(buf, delimiter="\t", quoting=csv.QUOTE_MINIMAL)
+    for row in rows:
+        metadata = row.get("metadata")
+        values = [
+            row["id"],
+            row["source_url"],
+            row.get("title"),
+            row.get("content"),
+            row.get("country"),
+            row.get("source_name"),
+            row["scraped_at"].isoformat() if row.get("scraped_at") else None,
+            row.get("processed", False),
+            json.dumps(metadata) if metadata is not None else None,
+        ]
+        # None maps to the explicit sentinel so empty strings survive the
+        # round-trip as '' instead of collapsing to NULL (with NULL '',
+        # QUOTE_MINIMAL leaves '' unquoted and COPY would read it as NULL,
+        # diverging from what the multi-VALUES path stores)
+        writer.writerow(_COPY_NULL if v is None else v for v in values)
+    buf.seek(0)
+
+    db.execute(
+        text(
+            "CREATE TEMP TABLE raw_documents_stage "
+            "(LIKE raw_documents INCLUDING DEFAULTS) ON COMMIT DROP"
+        )
+    )
+
+    copy_sql = (
+        "COPY raw_documents_stage ({cols}) FROM STDIN "
+        "WITH (FORMAT csv, DELIMITER E'\\t', NULL E'\\\\N')".format(
+            cols=", ".join(f'"{c}"' for c in _RAW_DOCUMENT_COLUMNS)
+        )
+    )
+    cursor = db.connection().connection.cursor()
+    if hasattr(cursor, "copy_expert"):  # psycopg2
+        cursor.copy_expert(copy_sql, buf)
+    else:  # psycopg3
+        with cursor.copy(copy_sql) as copy:
+            copy.write(buf.getvalue())
+
+    result = db.execute(
+        text(
+            "INSERT INTO raw_documents SELECT * FROM raw_documents_stage "
+            "ON CONFLICT (source_url) DO NOTHING"
+        )
+    )
+    return result.rowcount
+
+
+# COPY's fixed overhead (staging table + stream setup) doesn't pay off for
+# small batches; below this row count the multi-VALUES insert wins.
+_COPY_THRESHOLD = int(os.getenv("COPY_THRESHOLD", "100"))
+
+
+def bulk_insert(db: Session, rows: list[dict]) -> int:
+    """Persist raw_documents rows via whichever bulk path fits the batch size.
+
+    Batches of ``_COPY_THRESHOLD`` rows or more go through the COPY staging
+    path; smaller ones use the single multi-VALUES ON CONFLICT insert. Both
+    dedupe on source_url and return the inserted count; the caller owns the
+    transaction and must commit.
+    """
+    if len(rows) >= _COPY_THRESHOLD:
+        return bulk_insert_with_copy(db, rows)
+    return bulk_insert_on_conflict(db, rows)
+
+
+# ---------------------------------------------------------------------------
+# Optional async engine (SCRAPER_ASYNC=1)
+# ---------------------------------------------------------------------------
+
+_async_session_factory = None
+
+
+def init_async_sessionmaker():
+    """Lazily build the asyncpg engine and session factory.
+
+    asyncpg's binary protocol and prepared-statement cache outperform the
+    sync drivers on INSERT-heavy paths. Kept lazy so Alembic and the
+    Scrapy/OECD paths never need asyncpg installed; callers gate usage
+    behind the SCRAPER_ASYNC=1 flag.
+    """
+    global _async_session_factory
+    if _async_session_factory is None:
+        from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+        url = os.environ["POSTGRES_URL"]
+        if url.startswith("postgresql://"):
+            url = url.replace("postgresql://", "postgresql+asyncpg://", 1)
+
+        async_engine = create_async_engine(
+            url,
+            pool_size=int(os.getenv("DB_POOL_SIZE", "25")),
+            max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "25")),
+            pool_recycle=1800,
+            pool_pre_ping=True,
+        )
+        _async_session_factory = async_sessionmaker(
+            async_engine, autoflush=False, expire_on_commit=False
+        )
+    return _async_session_factory
+
+
+async def async_bulk_insert_with_copy(db, rows: list[dict]) -> int:
+    """Async variant of :func:`bulk_insert_with_copy` using asyncpg COPY.
+
+    Streams records into the TEMP staging table with copy_records_to_table
+    (binary protocol, no client-side CSV encoding), then merges them with the
+    same ON CONFLICT insert as the sync path. The caller owns the transaction
+    and must commit.
+    """
+    if not rows:
+        return 0
+
+    await db.execute(
+        text(
+            "CREATE TEMP TABLE raw_documents_stage "
+            "(LIKE raw_documents INCLUDING DEFAULTS) ON COMMIT DROP"
+        )
+    )
+
+    records = [
+        (
+            row["id"],
+            row["source_url"],
+            row.get("title"),
+            row.get("content"),
+            row.get("country"),
+            row.get("source_name"),
+            row.get("scraped_at"),
+            row.get("processed", False),
+            json.dumps(row["metadata"]) if row.get("metadata") is not None else None,
+        )
+        for row in rows
+    ]
+
+    conn = await db.connection()
+    raw = await conn.get_raw_connection()
+    await raw.driver_connection.copy_records_to_table(
+        "raw_documents_stage", records=records, columns=list(_RAW_DOCUMENT_COLUMNS)
+    )
+
+    result = await db.execute(
+        text(
+            "INSERT INTO raw_documents SELECT * FROM raw_documents_stage "
+            "ON CONFLICT (source_url) DO NOTHING"
+        )
+    )
+    return result.rowcount
+
+
+def scraper_session() -> Session:
+    """Open a session for scrape ingest with synchronous_commit disabled.
+
+    Scraped rows are always re-fetchable (source_url is unique, so a lost
+    row is simply re-scraped next run), which makes waiting on WAL fsync at
+    commit pure latency overhead. With it off, the loss window on a crash is
+    bounded by wal_writer_delay. SET LOCAL scopes the setting to the
+    session's current transaction, so nothing leaks back to the pool.
+    """
+    db = SessionLocal()
+    db.execute(text("SET LOCAL synchronous_commit = off"))
+    return db
+
+
 def create_tables() -> None:
     logger.info("Creating database tables...")
     Base.metadata.create_all(bind=engine)
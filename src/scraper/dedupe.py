@@ -0,0 +1,113 @@
+"""Content-digest duplicate suppression shared by all scrapers.
+
+URL-based dedupe misses syndicated copies: the same article can appear in
+several BBC feeds, as an OECD/HAI cross-post, or as a World Bank report
+re-listed under a different URL. This module fingerprints the *content*
+instead — a digest over text normalized enough that trivial formatting
+differences collapse onto the same value — and remembers every digest seen
+across runs.
+"""
+
+import hashlib
+import os
+import pickle
+import string
+import threading
+from pathlib import Path
+
+from loguru import logger
+
+try:
+    from pybloom_live import ScalableBloomFilter
+except ImportError:
+    ScalableBloomFilter = None
+
+_DEFAULT_PATH = Path(os.getenv("CONTENT_DIGEST_PATH", ".scraper_content_digests"))
+
+# Strips punctuation and digits in one C-level translate pass; built once.
+_STRIP_TABLE = str.maketrans("", "", string.punctuation + string.digits)
+
+
+def content_digest(text: str) -> bytes:
+    """Digest of text normalized for near-duplicate comparison.
+
+    Lowercases, strips punctuation and digits (so reformatted dates and
+    numbering don't defeat the match), collapses whitespace, then hashes
+    with blake2b — the fastest cryptographic digest in the stdlib.
+    """
+    normalized = " ".join(text.lower().translate(_STRIP_TABLE).split())
+    return hashlib.blake2b(normalized.encode(), digest_size=16).digest()
+
+
+class ContentDigestFilter:
+    """Persistent set of content digests seen across scrape runs.
+
+    Backed by pybloom_live's ScalableBloomFilter when installed (constant
+    memory per element at a 1e-6 false-positive rate); falls back to a plain
+    set, which is exact but grows linearly with the corpus. Membership tests
+    and recording are separate on purpose: callers check digests up front but
+    only update()/save() after the rows they cover have actually committed,
+    so a failed insert or a dropped invalid item can never permanently shadow
+    a later valid copy of the same document.
+
+    Instances are thread-safe; save paths running in parallel flow threads
+    must go through shared() so they append to one filter instead of each
+    doing a load/save round-trip that overwrites the others' digests.
+    """
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, path: Path = _DEFAULT_PATH):
+        self._path = path
+        self._lock = threading.Lock()
+        if ScalableBloomFilter is not None:
+            self._seen = ScalableBloomFilter(
+                initial_capacity=1_000_000, error_rate=1e-6
+            )
+        else:
+            self._seen = set()
+
+    def __contains__(self, digest: bytes) -> bool:
+        with self._lock:
+            return digest in self._seen
+
+    def update(self, digests) -> None:
+        """Record digests whose rows are now durably stored."""
+        with self._lock:
+            for digest in digests:
+                self._seen.add(digest)
+
+    @classmethod
+    def shared(cls) -> "ContentDigestFilter":
+        """Process-wide filter, loaded from the default path on first use."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls.load()
+            return cls._shared
+
+    @classmethod
+    def load(cls, path: Path = _DEFAULT_PATH) -> "ContentDigestFilter":
+        flt = cls(path)
+        try:
+            with open(path, "rb") as fh:
+                flt._seen = pickle.load(fh)
+        except FileNotFoundError:
+            pass
+        except Exception as exc:
+            logger.warning(f"Could not load content-digest state from {path}: {exc}")
+        return flt
+
+    def save(self) -> None:
+        # pid-suffixed temp file: concurrent scraper processes each write
+        # their own staging file instead of interleaving into one
+        tmp = self._path.with_name(f"{self._path.name}.{os.getpid()}.tmp")
+        with self._lock:
+            try:
+                with open(tmp, "wb") as fh:
+                    pickle.dump(self._seen, fh)
+                tmp.replace(self._path)
+            except OSError as exc:
+                logger.warning(
+                    f"Could not persist content-digest state to {self._path}: {exc}"
+                )
@@ -22,6 +22,7 @@ from time import perf_counter
 
 from loguru import logger
 from prefect import flow, task
+from prefect.task_runners import ThreadPoolTaskRunner
 
 # Ensure the project root is on sys.path when this module is imported
 # directly (e.g. via `poetry run python src/scraper/flows.py`).
@@ -89,6 +90,24 @@ def run_stanford_task() -> int:
     return saved
 
 
+@task(name="run-worldbank", retries=3, retry_delay_seconds=30)
+def run_worldbank_task() -> int:
+    """Scrape the World Bank repository and persist new documents. Returns doc count."""
+    from src.scraper.spiders.worldbank_scraper import WorldBankScraper
+
+    source = "worldbank"
+    logger.info(f"[{source}] Starting scrape")
+    t0 = perf_counter()
+
+    scraper = WorldBankScraper()
+    items = scraper.run()
+    saved = scraper.save_to_db(items)
+
+    elapsed = perf_counter() - t0
+    logger.info(f"[{source}] {saved} docs saved in {elapsed:.1f}s")
+    return saved
+
+
 # ---------------------------------------------------------------------------
 # Flows
 # ---------------------------------------------------------------------------
@@ -119,21 +138,28 @@ def scrape_research_flow() -> int:
     return total
 
 
-@flow(name="scrape-all", log_prints=True)
+@flow(name="scrape-all", log_prints=True, task_runner=ThreadPoolTaskRunner(max_workers=3))
 def scrape_all_flow() -> int:
-    """Run all scrapers sequentially and log total docs saved.
+    """Run the httpx-based scrapers concurrently, then OECD, and log totals.
 
-    Execution order: BBC → OECD → Stanford HAI.
-    OECD is placed after the httpx-based scrapers so the Twisted reactor
-    starts only once and doesn't interfere with earlier tasks.
+    BBC, Stanford HAI, and World Bank are independent and I/O-bound, so they
+    are submitted together and joined before OECD runs. OECD stays outside
+    the concurrent block because Scrapy's Twisted reactor can only start once
+    per process (see module notes).
     """
-    bbc_saved = run_bbc_task()
+    futures = [
+        run_bbc_task.submit(),
+        run_stanford_task.submit(),
+        run_worldbank_task.submit(),
+    ]
+    bbc_saved, stanford_saved, worldbank_saved = (f.result() for f in futures)
+
     oecd_saved = run_oecd_task()
-    stanford_saved = run_stanford_task()
 
-    total = bbc_saved + oecd_saved + stanford_saved
+    total = bbc_saved + stanford_saved + worldbank_saved + oecd_saved
     logger.info(
         f"[scrape_all_flow] Docs saved — "
-        f"bbc={bbc_saved} oecd={oecd_saved} stanford={stanford_saved} total={total}"
+        f"bbc={bbc_saved} stanford={stanford_saved} worldbank={worldbank_saved} "
+        f"oecd={oecd_saved} total={total}"
     )
     return total
@@ -1,11 +1,31 @@
+import secrets
+import time
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, Integer, String, Text
+from sqlalchemy import Boolean, DateTime, Integer, String, Text, func
 from sqlalchemy.dialects.postgresql import JSON, UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
+def uuid7() -> uuid.UUID:
+    """Generate a time-ordered UUIDv7 (RFC 9562 layout).
+
+    48-bit unix-millisecond timestamp, version/variant bits, and 74 random
+    bits. Unlike uuid4, consecutive keys sort by creation time, so B-tree
+    inserts append near the rightmost leaf instead of splitting random pages.
+    """
+    ts_ms = time.time_ns() // 1_000_000
+    value = (
+        ((ts_ms & 0xFFFF_FFFF_FFFF) << 80)
+        | (0x7 << 76)
+        | (secrets.randbits(12) << 64)
+        | (0b10 << 62)
+        | secrets.randbits(62)
+    )
+    return uuid.UUID(int=value)
+
+
 class Base(DeclarativeBase):
     pass
 
@@ -13,13 +33,17 @@ class Base(DeclarativeBase):
 class RawDocument(Base):
     __tablename__ = "raw_documents"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     source_url: Mapped[str] = mapped_column(String, unique=True, nullable=False)
     title: Mapped[str | None] = mapped_column(String, nullable=True)
     content: Mapped[str | None] = mapped_column(Text, nullable=True)
     country: Mapped[str | None] = mapped_column(String, nullable=True)
     source_name: Mapped[str | None] = mapped_column(String, nullable=True)
-    scraped_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    # Carries the upstream publish date when the scraper knows it; the DB
+    # fills in now() for rows inserted without one.
+    scraped_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=func.now(), nullable=False
+    )
     processed: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     metadata_: Mapped[dict | None] = mapped_column("metadata", JSON, nullable=True)
 
@@ -27,9 +51,11 @@ class RawDocument(Base):
 class ScrapeRun(Base):
     __tablename__ = "scrape_runs"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     source_name: Mapped[str] = mapped_column(String, nullable=False)
-    started_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    started_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=func.now(), nullable=False
+    )
     ended_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
     docs_scraped: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     status: Mapped[str] = mapped_column(String, nullable=False)
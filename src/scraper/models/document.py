@@ -1,10 +1,13 @@
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl
 
 
 class OECDDocument(BaseModel):
+    # Unknown scraper fields are dropped rather than rejected
+    model_config = ConfigDict(extra="ignore")
+
     title: str
     source_url: HttpUrl
     country: Optional[str] = None
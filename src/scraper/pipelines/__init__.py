@@ -1,24 +1,29 @@
 import uuid
 from datetime import datetime
+from time import perf_counter
 
 from loguru import logger
 from pydantic import ValidationError
-from sqlalchemy.exc import IntegrityError
 
-from src.scraper.database import SessionLocal
-from src.scraper.models import RawDocument, ScrapeRun
+from src.scraper.database import SessionLocal, bulk_insert, scraper_session
+from src.scraper.models import ScrapeRun, uuid7
 from src.scraper.models.document import OECDDocument
 
 
 class PostgresPipeline:
     """Validates items with Pydantic, deduplicates by source_url, and persists to PostgreSQL.
 
+    Items are buffered during the crawl and flushed in a single
+    INSERT ... ON CONFLICT DO NOTHING transaction when the spider closes,
+    instead of one SELECT + INSERT round-trip per item.
+
     Also manages a ScrapeRun record so every crawl is auditable.
     """
 
     def __init__(self):
         self._run_id: uuid.UUID | None = None
         self._docs_scraped: int = 0
+        self._buffer: list[dict] = []
 
     # ------------------------------------------------------------------
     # Scrapy lifecycle
@@ -27,9 +32,9 @@ class PostgresPipeline:
     def open_spider(self, spider):
         db = SessionLocal()
         try:
+            # started_at is filled server-side by the now() default
             run = ScrapeRun(
                 source_name=spider.name,
-                started_at=datetime.utcnow(),
                 status="running",
             )
             db.add(run)
@@ -44,6 +49,8 @@ class PostgresPipeline:
         logger.info(f"Scrape run {self._run_id} started for spider '{spider.name}'")
 
     def close_spider(self, spider):
+        self._flush()
+
         db = SessionLocal()
         try:
             run = db.get(ScrapeRun, self._run_id)
@@ -66,44 +73,45 @@ class PostgresPipeline:
     # ------------------------------------------------------------------
 
     def process_item(self, item, spider):
-        # Validate with Pydantic
+        # Validate with Pydantic; persistence happens at flush time
         try:
-            doc = OECDDocument(**item)
+            doc = OECDDocument.model_validate(dict(item))
         except ValidationError as exc:
             logger.warning(f"Validation error for {item.get('source_url')!r}: {exc}")
             return item
 
-        url_str = str(doc.source_url)
+        self._buffer.append(
+            {
+                "id": uuid7(),
+                "source_url": str(doc.source_url),
+                "title": doc.title,
+                "content": doc.content,
+                "country": doc.country,
+                "source_name": doc.source_name,
+                "scraped_at": doc.scraped_at,
+                "processed": False,
+                "metadata": None,
+            }
+        )
+        return item
+
+    def _flush(self) -> None:
+        if not self._buffer:
+            return
 
-        db = SessionLocal()
+        t0 = perf_counter()
+        db = scraper_session()
         try:
-            # Duplicate check
-            exists = db.query(RawDocument).filter(RawDocument.source_url == url_str).first()
-            if exists:
-                logger.debug(f"Skipping duplicate: {url_str}")
-                return item
-
-            raw = RawDocument(
-                source_url=url_str,
-                title=doc.title,
-                content=doc.content,
-                country=doc.country,
-                source_name=doc.source_name,
-                scraped_at=doc.scraped_at,
-                processed=False,
-            )
-            db.add(raw)
+            saved = bulk_insert(db, self._buffer)
             db.commit()
-            self._docs_scraped += 1
-            logger.info(f"Saved [{self._docs_scraped}]: {doc.title[:80]!r}")
-        except IntegrityError:
-            # Race condition: another process inserted the same URL between our check and insert
-            db.rollback()
-            logger.debug(f"Duplicate race condition, skipping: {url_str}")
+            self._docs_scraped += saved
+            logger.info(
+                f"batch: saved={saved} dupes={len(self._buffer) - saved} "
+                f"elapsed={perf_counter() - t0:.2f}s"
+            )
         except Exception as exc:
             db.rollback()
-            logger.error(f"DB error for {url_str!r}: {exc}")
+            logger.error(f"Bulk insert failed: {exc}")
         finally:
             db.close()
-
-        return item
+            self._buffer.clear()
@@ -0,0 +1,64 @@
+"""Shared httpx helpers for the async scrapers.
+
+Fan-out fetches go through one AsyncClient per batch so TCP/TLS handshakes
+are amortized across requests via connection pooling, with a semaphore
+bounding in-flight concurrency.
+"""
+
+import asyncio
+
+import httpx
+from loguru import logger
+
+try:
+    # httpx needs the optional h2 package for HTTP/2; when it's present the
+    # fan-out multiplexes over one connection per host instead of opening
+    # a pooled connection per in-flight request.
+    import h2  # noqa: F401
+
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+_TIMEOUT = 30
+_LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=20)
+
+# Default in-flight request bound for gather-style fan-out
+MAX_CONCURRENCY = 16
+
+
+def new_async_client(**kwargs) -> httpx.AsyncClient:
+    """Build an AsyncClient with the shared pool limits and timeout.
+
+    HTTP/2 is negotiated when the h2 package is installed, falling back to
+    HTTP/1.1 keep-alive pooling otherwise.
+    """
+    kwargs.setdefault("timeout", _TIMEOUT)
+    kwargs.setdefault("follow_redirects", True)
+    kwargs.setdefault("limits", _LIMITS)
+    kwargs.setdefault("http2", _HTTP2)
+    return httpx.AsyncClient(**kwargs)
+
+
+async def fetch(
+    client: httpx.AsyncClient,
+    sem: asyncio.Semaphore,
+    url: str,
+    params: dict | None = None,
+    headers: dict | None = None,
+) -> httpx.Response | None:
+    """GET one URL under the semaphore; returns None on HTTP errors.
+
+    304 Not Modified responses (from conditional requests) are returned
+    as-is, not treated as errors.
+    """
+    async with sem:
+        try:
+            response = await client.get(url, params=params, headers=headers)
+            if response.status_code == 304:
+                return response
+            response.raise_for_status()
+            return response
+        except httpx.HTTPError as exc:
+            logger.error(f"HTTP error fetching {url!r}: {exc}")
+            return None
@@ -1,17 +1,24 @@
 """Abstract base class for all SovereignLens scrapers."""
 
-import uuid
+import asyncio
+import os
 from abc import ABC, abstractmethod
 from datetime import datetime
+from time import perf_counter
 
 from loguru import logger
-from pydantic import ValidationError
-from sqlalchemy.exc import IntegrityError
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy import insert, select, text, update
 
-from src.scraper.database import SessionLocal
-from src.scraper.models import RawDocument, ScrapeRun
+from src.scraper.database import SessionLocal, bulk_insert, scraper_session
+from src.scraper.dedupe import ContentDigestFilter, content_digest
+from src.scraper.models import RawDocument, ScrapeRun, uuid7
 from src.scraper.models.document import OECDDocument
 
+# Compiled once; validates a whole batch in a single C-level pass instead of
+# per-instance validator setup for every item.
+_LIST_VALIDATOR = TypeAdapter(list[OECDDocument])
+
 
 class BaseScraper(ABC):
     source_name: str = ""
@@ -22,90 +29,295 @@ class BaseScraper(ABC):
         ...
 
     def save_to_db(self, items: list[dict]) -> int:
-        """Validate and persist items to PostgreSQL. Returns count saved."""
+        """Validate and persist items to PostgreSQL. Returns count saved.
+
+        All items are validated up front, then persisted in one session and
+        one transaction via bulk_insert — a batched multi-VALUES
+        INSERT ... ON CONFLICT DO NOTHING, or COPY through a staging table
+        for large batches — rather than a session open and commit per row.
+        The ON CONFLICT merge would absorb duplicates on its own; the
+        _existing_urls pre-filter is kept anyway so incremental runs don't
+        ship content for already-stored rows over the wire. The ScrapeRun
+        record is opened and closed inside the same transaction, so a crash
+        cannot leak a dangling status='running' row.
+        """
         if not items:
             logger.info(f"[{self.source_name}] No items to save.")
             return 0
 
-        run_id = self._start_run()
-        saved = 0
+        # In-batch dedupe: paginated feeds and retries can yield the same URL
+        # twice in one run; last occurrence wins, no validation or DB cost paid
+        items = list(
+            {item.get("source_url"): item for item in items if item.get("source_url")}.values()
+        )
 
-        for item in items:
-            try:
-                doc = OECDDocument(**item)
-            except ValidationError as exc:
-                logger.warning(f"Validation error for {item.get('source_url')!r}: {exc}")
-                continue
+        docs = self._validate_items(items)
+        if not docs:
+            logger.info(f"[{self.source_name}] No valid items to save.")
+            return 0
 
-            url_str = str(doc.source_url)
-            db = SessionLocal()
+        # Cross-source content dedupe: syndicated copies of the same article
+        # arrive under different URLs, so fingerprint the normalized content
+        # against the persistent digest filter as well. Runs after validation
+        # and only checks membership here — digests are recorded once their
+        # batch commits, so invalid items and failed inserts never shadow a
+        # later valid copy of the same document.
+        # shared() because the flow runs several save paths in parallel
+        # threads — per-thread load/save would drop the other threads' digests
+        digest_filter = ContentDigestFilter.shared()
+        before = len(docs)
+        docs, new_digests = self._drop_duplicate_content(docs, digest_filter)
+        if before - len(docs):
+            logger.info(
+                f"[{self.source_name}] {before - len(docs)} items dropped "
+                "as content duplicates"
+            )
+        if not docs:
+            logger.info(f"[{self.source_name}] No new items to save.")
+            return 0
+
+        if os.getenv("SCRAPER_ASYNC") == "1":
+            return asyncio.run(self._save_to_db_async(docs, digest_filter, new_digests))
+
+        run_id = uuid7()
+        saved = 0
+        t0 = perf_counter()
+        with scraper_session() as db:
             try:
-                exists = db.query(RawDocument).filter(RawDocument.source_url == url_str).first()
-                if exists:
-                    logger.debug(f"Skipping duplicate: {url_str}")
-                    continue
-
-                raw = RawDocument(
-                    source_url=url_str,
-                    title=doc.title,
-                    content=doc.content,
-                    country=doc.country,
-                    source_name=doc.source_name,
-                    scraped_at=doc.scraped_at,
-                    processed=False,
+                # started_at is filled server-side by the now() default
+                db.execute(
+                    insert(ScrapeRun).values(
+                        id=run_id,
+                        source_name=self.source_name,
+                        status="running",
+                    )
+                )
+                existing = self._existing_urls(db, [str(doc.source_url) for doc in docs])
+                rows = [
+                    self._doc_to_row(doc)
+                    for doc in docs
+                    if str(doc.source_url) not in existing
+                ]
+                saved = bulk_insert(db, rows)
+                db.execute(
+                    update(ScrapeRun)
+                    .where(ScrapeRun.id == run_id)
+                    .values(ended_at=datetime.utcnow(), docs_scraped=saved, status="success")
                 )
-                db.add(raw)
                 db.commit()
-                saved += 1
-                logger.info(f"Saved [{saved}]: {doc.title[:80]!r}")
-            except IntegrityError:
-                db.rollback()
-                logger.debug(f"Duplicate race condition, skipping: {url_str}")
+                # The batch is durable; only now do its digests enter the filter
+                digest_filter.update(new_digests)
+                digest_filter.save()
+                self._on_batch_committed()
+                logger.info(
+                    f"[{self.source_name}] batch: saved={saved} "
+                    f"dupes={len(docs) - saved} elapsed={perf_counter() - t0:.2f}s"
+                )
             except Exception as exc:
                 db.rollback()
-                logger.error(f"DB error for {url_str!r}: {exc}")
-            finally:
-                db.close()
-
-        self._end_run(run_id, saved)
+                logger.error(f"[{self.source_name}] Bulk insert failed: {exc}")
+                self._record_failed_run(db, run_id)
         return saved
 
-    # ------------------------------------------------------------------
-    # ScrapeRun lifecycle helpers
-    # ------------------------------------------------------------------
+    def _on_batch_committed(self) -> None:
+        """Hook run once a batch has durably committed.
 
-    def _start_run(self) -> uuid.UUID:
-        db = SessionLocal()
+        Scrapers with fetch-avoidance state (ETags, cursors) override this so
+        that state persists only for batches that actually reached the
+        database — the same commit-then-record rule the content-digest
+        filter follows. A failed insert must leave the state untouched, or
+        the skipped-but-never-stored documents would never be refetched.
+        """
+
+    def _record_failed_run(self, db, run_id) -> None:
+        """Re-insert the ScrapeRun row with status='failed'.
+
+        The rollback above also discarded the run row opened with the batch;
+        writing it again in a fresh transaction keeps every crawl auditable
+        even when persistence fails.
+        """
         try:
-            run = ScrapeRun(
-                source_name=self.source_name,
-                started_at=datetime.utcnow(),
-                status="running",
+            db.execute(
+                insert(ScrapeRun).values(
+                    id=run_id,
+                    source_name=self.source_name,
+                    status="failed",
+                    ended_at=datetime.utcnow(),
+                    docs_scraped=0,
+                )
             )
-            db.add(run)
             db.commit()
-            db.refresh(run)
-            run_id = run.id
-        except Exception:
+        except Exception as exc:
             db.rollback()
-            raise
-        finally:
-            db.close()
-        logger.info(f"Scrape run {run_id} started for '{self.source_name}'")
-        return run_id
-
-    def _end_run(self, run_id: uuid.UUID, docs_saved: int) -> None:
-        db = SessionLocal()
+            logger.error(f"[{self.source_name}] Could not record failed run: {exc}")
+
+    async def _save_to_db_async(
+        self,
+        docs: list["OECDDocument"],
+        digest_filter: ContentDigestFilter,
+        new_digests: list[bytes],
+    ) -> int:
+        """asyncpg save path (SCRAPER_ASYNC=1): COPY records over the binary
+        protocol instead of a text-mode multi-VALUES insert. The ON CONFLICT
+        merge handles duplicates, so no existence pre-filter is needed."""
+        from src.scraper.database import async_bulk_insert_with_copy, init_async_sessionmaker
+
+        session_factory = init_async_sessionmaker()
+        run_id = uuid7()
+        saved = 0
+        t0 = perf_counter()
+        async with session_factory() as db:
+            try:
+                await db.execute(text("SET LOCAL synchronous_commit = off"))
+                await db.execute(
+                    insert(ScrapeRun).values(
+                        id=run_id,
+                        source_name=self.source_name,
+                        status="running",
+                    )
+                )
+                rows = [self._doc_to_row(doc) for doc in docs]
+                saved = await async_bulk_insert_with_copy(db, rows)
+                await db.execute(
+                    update(ScrapeRun)
+                    .where(ScrapeRun.id == run_id)
+                    .values(ended_at=datetime.utcnow(), docs_scraped=saved, status="success")
+                )
+                await db.commit()
+                digest_filter.update(new_digests)
+                digest_filter.save()
+                self._on_batch_committed()
+                logger.info(
+                    f"[{self.source_name}] batch: saved={saved} "
+                    f"dupes={len(docs) - saved} elapsed={perf_counter() - t0:.2f}s"
+                )
+            except Exception as exc:
+                await db.rollback()
+                logger.error(f"[{self.source_name}] Bulk insert failed: {exc}")
+                # Same audit contract as the sync path: the rollback discarded
+                # the run row, so re-record the failure in a fresh transaction
+                try:
+                    await db.execute(
+                        insert(ScrapeRun).values(
+                            id=run_id,
+                            source_name=self.source_name,
+                            status="failed",
+                            ended_at=datetime.utcnow(),
+                            docs_scraped=0,
+                        )
+                    )
+                    await db.commit()
+                except Exception as audit_exc:
+                    await db.rollback()
+                    logger.error(
+                        f"[{self.source_name}] Could not record failed run: {audit_exc}"
+                    )
+        return saved
+
+    # ------------------------------------------------------------------
+    # Validation / row building
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _validate_items(items: list[dict]) -> list[OECDDocument]:
+        """Validate the batch in one pass; on failure, re-validate per item so
+        only the offending rows are reported and dropped."""
         try:
-            run = db.get(ScrapeRun, run_id)
-            if run:
-                run.ended_at = datetime.utcnow()
-                run.docs_scraped = docs_saved
-                run.status = "success"
-            db.commit()
-        except Exception:
-            db.rollback()
-            raise
-        finally:
-            db.close()
-        logger.info(f"Scrape run {run_id} finished — {docs_saved} document(s) saved")
+            return _LIST_VALIDATOR.validate_python(items)
+        except ValidationError:
+            docs = []
+            for item in items:
+                try:
+                    docs.append(OECDDocument.model_validate(item))
+                except ValidationError as exc:
+                    logger.warning(f"Validation error for {item.get('source_url')!r}: {exc}")
+            return docs
+
+    @staticmethod
+    def _drop_duplicate_content(
+        docs: list[OECDDocument], digest_filter: ContentDigestFilter
+    ) -> tuple[list[OECDDocument], list[bytes]]:
+        """Drop docs whose normalized content was already stored in any run.
+
+        Returns the kept docs and their digests; the caller records the
+        digests via digest_filter.update() only after the batch commits.
+        Docs with empty content are passed through undigested — a shared
+        empty-content key would let the first such item permanently shadow
+        every other one across all sources.
+        """
+        kept: list[OECDDocument] = []
+        new_digests: list[bytes] = []
+        batch_seen: set[bytes] = set()
+        for doc in docs:
+            if not doc.content:
+                kept.append(doc)
+                continue
+            digest = content_digest(doc.content)
+            if digest in digest_filter or digest in batch_seen:
+                continue
+            batch_seen.add(digest)
+            kept.append(doc)
+            new_digests.append(digest)
+        return kept, new_digests
+
+    @classmethod
+    def _filter_existing(cls, items: list[dict]) -> list[dict]:
+        """Drop in-batch URL duplicates and items already in the database.
+
+        Shared by all scrapers: one session and one chunked ``IN (...)``
+        query against the unique source_url index for the whole batch. The
+        known URLs come back as a frozenset and seed the seen-set, so the
+        in-batch dedupe and the DB filter happen in a single sweep over the
+        items instead of one rebuilt list per stage.
+        """
+        if not items:
+            return []
+
+        urls = [item["source_url"] for item in items]
+        with SessionLocal() as db:
+            try:
+                existing = frozenset(cls._existing_urls(db, urls))
+            except Exception as exc:
+                logger.error(f"[{cls.source_name}] DB lookup error during deduplication: {exc}")
+                existing = frozenset()
+
+        seen = set(existing)
+        kept = []
+        for item in items:
+            url = item["source_url"]
+            if url in seen:
+                continue
+            seen.add(url)
+            kept.append(item)
+        return kept
+
+    @staticmethod
+    def _existing_urls(db, urls: list[str]) -> set[str]:
+        """Return the subset of urls already present in raw_documents.
+
+        One ``IN (...)`` query per 1000 URLs (instead of one per item),
+        chunked to stay under PostgreSQL's parameter limits.
+        """
+        existing: set[str] = set()
+        for start in range(0, len(urls), 1000):
+            chunk = urls[start : start + 1000]
+            existing.update(
+                db.scalars(
+                    select(RawDocument.source_url).where(RawDocument.source_url.in_(chunk))
+                )
+            )
+        return existing
+
+    @staticmethod
+    def _doc_to_row(doc: OECDDocument) -> dict:
+        return {
+            "id": uuid7(),
+            "source_url": str(doc.source_url),
+            "title": doc.title,
+            "content": doc.content,
+            "country": doc.country,
+            "source_name": doc.source_name,
+            "scraped_at": doc.scraped_at,
+            "processed": False,
+            "metadata": None,
+        }
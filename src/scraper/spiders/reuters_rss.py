@@ -1,13 +1,14 @@
-"""BBC News RSS scraper using httpx + feedparser."""
+"""BBC News RSS scraper using httpx + lxml (feedparser as fallback)."""
 
-from datetime import datetime
+import asyncio
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 
 import feedparser
-import httpx
 from loguru import logger
+from lxml import etree
 
-from src.scraper.database import SessionLocal
-from src.scraper.models import RawDocument
+from src.scraper.spiders._http import MAX_CONCURRENCY, fetch, new_async_client
 from src.scraper.spiders.base_scraper import BaseScraper
 
 FEEDS = [
@@ -21,31 +22,41 @@ class BBCRSSScraper(BaseScraper):
     source_name = "bbc_news"
 
     def run(self) -> list[dict]:
-        """Fetch BBC News RSS feeds and return new items as a list of dicts."""
-        items: list[dict] = []
-
-        for feed_url in FEEDS:
+        """Fetch BBC News RSS feeds and return new items as a list of dicts.
+
+        All feeds download concurrently over one shared AsyncClient, and each
+        feed is parsed in a worker thread as soon as its bytes arrive, so
+        feedparser's CPU work overlaps the remaining downloads instead of
+        blocking the event loop.
+        """
+
+        async def _fetch_and_parse(client, sem, url: str) -> list[dict]:
+            response = await fetch(client, sem, url)
+            if response is None:
+                return []
             try:
-                feed_items = self._fetch_feed(feed_url)
-                items.extend(feed_items)
+                return await asyncio.to_thread(self._parse_feed, url, response.content)
             except Exception as exc:
-                logger.error(f"Failed to process feed {feed_url!r}: {exc}")
-                continue
+                logger.error(f"Failed to process feed {url!r}: {exc}")
+                return []
+
+        async def _gather() -> list[list[dict]]:
+            async with new_async_client() as client:
+                sem = asyncio.Semaphore(MAX_CONCURRENCY)
+                return await asyncio.gather(
+                    *(_fetch_and_parse(client, sem, url) for url in FEEDS)
+                )
+
+        items: list[dict] = []
+        for feed_items in asyncio.run(_gather()):
+            items.extend(feed_items)
 
-        # Deduplicate across feeds (same article may appear in multiple feeds)
-        seen: set[str] = set()
-        unique_items = []
-        for item in items:
-            url = item["source_url"]
-            if url not in seen:
-                seen.add(url)
-                unique_items.append(item)
-
-        # Filter out URLs already in the database
-        new_items = self._filter_existing(unique_items)
+        # Single sweep drops cross-feed duplicates (the same article appears
+        # in multiple feeds) and URLs already in the database
+        new_items = self._filter_existing(items)
         logger.info(
-            f"BBC News: {len(unique_items)} entries fetched, "
-            f"{len(unique_items) - len(new_items)} already in DB, "
+            f"BBC News: {len(items)} entries fetched, "
+            f"{len(items) - len(new_items)} duplicate or already in DB, "
             f"{len(new_items)} new"
         )
         return new_items
@@ -54,17 +65,58 @@ class BBCRSSScraper(BaseScraper):
     # Internal helpers
     # ------------------------------------------------------------------
 
-    def _fetch_feed(self, url: str) -> list[dict]:
-        """Fetch a single RSS feed via httpx and parse it with feedparser."""
-        logger.info(f"Fetching feed: {url}")
+    def _parse_feed(self, url: str, xml_bytes: bytes) -> list[dict]:
+        """Parse one downloaded RSS feed.
+
+        The BBC feeds are well-formed RSS 2.0 and we only store four fields,
+        so the default path walks the XML with lxml's C parser. feedparser's
+        tolerant (but pure-Python, much slower) parser is kept as a fallback
+        for malformed XML.
+        """
         try:
-            response = httpx.get(url, timeout=30, follow_redirects=True)
-            response.raise_for_status()
-        except httpx.HTTPError as exc:
-            logger.error(f"HTTP error fetching {url!r}: {exc}")
-            return []
+            items = self._parse_feed_lxml(xml_bytes)
+        except etree.XMLSyntaxError as exc:
+            logger.warning(f"lxml parse failed for {url!r} ({exc}); using feedparser")
+            items = self._parse_feed_feedparser(url, xml_bytes)
 
-        feed = feedparser.parse(response.text)
+        logger.info(f"Feed {url}: parsed {len(items)} entries")
+        return items
+
+    def _parse_feed_lxml(self, xml_bytes: bytes) -> list[dict]:
+        root = etree.fromstring(xml_bytes)
+        items = []
+        for item_el in root.iterfind(".//item"):
+            title = (item_el.findtext("title") or "").strip()
+            link = (item_el.findtext("link") or "").strip()
+            if not title or not link:
+                continue
+
+            summary = (item_el.findtext("description") or "").strip()
+
+            scraped_at = datetime.utcnow()
+            pub_date = item_el.findtext("pubDate")
+            if pub_date:
+                try:
+                    parsed = parsedate_to_datetime(pub_date)
+                    if parsed.tzinfo is not None:
+                        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+                    scraped_at = parsed
+                except (TypeError, ValueError):
+                    pass
+
+            items.append(
+                {
+                    "title": title,
+                    "source_url": link,
+                    "content": summary or title,
+                    "source_name": self.source_name,
+                    "scraped_at": scraped_at,
+                }
+            )
+        return items
+
+    def _parse_feed_feedparser(self, url: str, xml_bytes: bytes) -> list[dict]:
+        feed = feedparser.parse(xml_bytes)
 
         if feed.bozo and feed.bozo_exception:
             logger.warning(f"Feed parse warning for {url!r}: {feed.bozo_exception}")
@@ -78,8 +130,6 @@ class BBCRSSScraper(BaseScraper):
             except Exception as exc:
                 logger.error(f"Error parsing entry {entry.get('link', '?')!r}: {exc}")
                 continue
-
-        logger.info(f"Feed {url}: parsed {len(items)} entries")
         return items
 
     def _parse_entry(self, entry) -> dict | None:
@@ -109,24 +159,3 @@ class BBCRSSScraper(BaseScraper):
             "scraped_at": scraped_at,
         }
 
-    def _filter_existing(self, items: list[dict]) -> list[dict]:
-        """Remove items whose source_url is already in the database."""
-        if not items:
-            return []
-
-        urls = [item["source_url"] for item in items]
-        db = SessionLocal()
-        try:
-            existing = {
-                row.source_url
-                for row in db.query(RawDocument.source_url)
-                .filter(RawDocument.source_url.in_(urls))
-                .all()
-            }
-        except Exception as exc:
-            logger.error(f"DB lookup error during deduplication: {exc}")
-            existing = set()
-        finally:
-            db.close()
-
-        return [item for item in items if item["source_url"] not in existing]
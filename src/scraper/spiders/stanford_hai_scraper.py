@@ -5,15 +5,15 @@ title + body text from each news entry, and stores results in raw_documents.
 No per-page HTTP delays needed — the API returns clean JSON.
 """
 
+import asyncio
 from datetime import datetime
 
-import httpx
-from bs4 import BeautifulSoup
 from loguru import logger
 
 from src.scraper.database import SessionLocal
-from src.scraper.models import RawDocument
+from src.scraper.spiders._http import MAX_CONCURRENCY, fetch, new_async_client
 from src.scraper.spiders.base_scraper import BaseScraper
+from src.scraper.utils import html_to_text, json_loads
 
 _API_BASE = "https://hai.stanford.edu/cms/api/collections/news/entries"
 _SITE_BASE = "https://hai.stanford.edu"
@@ -27,67 +27,90 @@ class StanfordHAIScraper(BaseScraper):
         entries = self._fetch_all_entries()
         logger.info(f"[stanford_hai] {len(entries)} entries fetched from CMS API")
 
+        # Resolve each entry's canonical URL first and drop known ones, so the
+        # HTML -> text extraction pass only runs for entries not yet stored.
+        candidates = [
+            (url, entry) for entry in entries if (url := self._entry_url(entry))
+        ]
+        with SessionLocal() as db:
+            try:
+                existing = self._existing_urls(db, [url for url, _ in candidates])
+            except Exception as exc:
+                logger.error(f"[stanford_hai] DB lookup error during deduplication: {exc}")
+                existing = set()
+
         items = []
-        for entry in entries:
-            item = self._parse_entry(entry)
+        for url, entry in candidates:
+            if url in existing:
+                continue
+            item = self._parse_entry(entry, url)
             if item:
                 items.append(item)
 
-        logger.info(f"[stanford_hai] {len(items)} entries parsed with sufficient content")
-
-        new_items = self._filter_existing(items)
         logger.info(
-            f"[stanford_hai] {len(items) - len(new_items)} already in DB, "
-            f"{len(new_items)} new"
+            f"[stanford_hai] {len(candidates)} candidate entries, "
+            f"{len(existing)} already in DB, {len(items)} new with sufficient content"
         )
-        return new_items
+        return items
 
     def _fetch_all_entries(self) -> list[dict]:
-        """Paginate through the CMS API and collect all news entries."""
-        entries = []
-        page = 1
-
-        while True:
-            try:
-                response = httpx.get(
-                    _API_BASE, params={"page": page}, timeout=30, follow_redirects=True
-                )
-                response.raise_for_status()
-                data = response.json()
-            except Exception as exc:
-                logger.error(f"[stanford_hai] Error fetching page {page}: {exc}")
-                break
-
-            page_data = data.get("data", [])
-            if not page_data:
-                break
-
-            entries.extend(page_data)
-            logger.info(f"[stanford_hai] Page {page}: {len(page_data)} entries")
-
-            meta = data.get("meta", {})
-            last_page = meta.get("last_page", 1)
-            if page >= last_page:
-                break
-            page += 1
-
-        return entries
-
-    def _parse_entry(self, entry: dict) -> dict | None:
-        # Skip external media mentions — they have no body content
+        """Collect all news entries from the CMS API.
+
+        Page 1 is fetched first to learn the page count; the remaining pages
+        then download concurrently over one shared client, so the crawl takes
+        ~one round-trip of wall time instead of one per page.
+        """
+
+        async def _gather() -> list[dict]:
+            entries: list[dict] = []
+            async with new_async_client() as client:
+                sem = asyncio.Semaphore(MAX_CONCURRENCY)
+
+                first = await fetch(client, sem, _API_BASE, params={"page": 1})
+                if first is None:
+                    return entries
+                try:
+                    data = json_loads(first.content)
+                except ValueError as exc:
+                    logger.error(f"[stanford_hai] Bad JSON on page 1: {exc}")
+                    return entries
+                entries.extend(data.get("data", []))
+                last_page = data.get("meta", {}).get("last_page", 1)
+
+                if last_page > 1:
+                    pages = range(2, last_page + 1)
+                    responses = await asyncio.gather(
+                        *(
+                            fetch(client, sem, _API_BASE, params={"page": page})
+                            for page in pages
+                        )
+                    )
+                    for page, response in zip(pages, responses):
+                        if response is None:
+                            continue
+                        try:
+                            entries.extend(json_loads(response.content).get("data", []))
+                        except ValueError as exc:
+                            logger.error(f"[stanford_hai] Bad JSON on page {page}: {exc}")
+            return entries
+
+        return asyncio.run(_gather())
+
+    @staticmethod
+    def _entry_url(entry: dict) -> str | None:
+        """Canonical article URL, or None for external media mentions."""
         if entry.get("destination"):
             return None
 
-        title = (entry.get("title") or "").strip()
-        if not title:
-            return None
-
-        # Build canonical URL from permalink or uri
         permalink = entry.get("permalink") or ""
         if not permalink:
             uri = entry.get("uri") or ""
             permalink = _SITE_BASE + uri if uri else ""
-        if not permalink:
+        return permalink or None
+
+    def _parse_entry(self, entry: dict, permalink: str) -> dict | None:
+        title = (entry.get("title") or "").strip()
+        if not title:
             return None
 
         content = self._extract_content(entry)
@@ -98,7 +121,7 @@ class StanfordHAIScraper(BaseScraper):
         raw_date = entry.get("date") or ""
         if raw_date:
             try:
-                scraped_at = datetime.strptime(raw_date[:19], "%Y-%m-%dT%H:%M:%S")
+                scraped_at = datetime.fromisoformat(raw_date[:19])
             except ValueError:
                 pass
 
@@ -119,7 +142,7 @@ class StanfordHAIScraper(BaseScraper):
             for rt in rich_texts:
                 html = (rt.get("text") or "").strip()
                 if html:
-                    text = BeautifulSoup(html, "html.parser").get_text(separator=" ", strip=True)
+                    text = html_to_text(html)
                     if text:
                         parts.append(text)
 
@@ -129,27 +152,7 @@ class StanfordHAIScraper(BaseScraper):
         # Fallback: dek (short summary, often HTML)
         dek = (entry.get("dek") or "").strip()
         if dek:
-            return BeautifulSoup(dek, "html.parser").get_text(separator=" ", strip=True)
+            return html_to_text(dek)
 
         return ""
 
-    def _filter_existing(self, items: list[dict]) -> list[dict]:
-        if not items:
-            return []
-
-        urls = [item["source_url"] for item in items]
-        db = SessionLocal()
-        try:
-            existing = {
-                row.source_url
-                for row in db.query(RawDocument.source_url)
-                .filter(RawDocument.source_url.in_(urls))
-                .all()
-            }
-        except Exception as exc:
-            logger.error(f"[stanford_hai] DB lookup error during deduplication: {exc}")
-            existing = set()
-        finally:
-            db.close()
-
-        return [item for item in items if item["source_url"] not in existing]
@@ -4,47 +4,109 @@ Queries the World Bank search API for AI-related documents (reports, papers,
 policy briefs) and stores title, abstract, and URL in the raw_documents table.
 """
 
+import asyncio
+import json
+import os
 from datetime import datetime
+from pathlib import Path
 
-import httpx
 from loguru import logger
 
-from src.scraper.database import SessionLocal
-from src.scraper.models import RawDocument
+from src.scraper.spiders._http import MAX_CONCURRENCY, fetch, new_async_client
 from src.scraper.spiders.base_scraper import BaseScraper
+from src.scraper.utils import json_loads
 
 _API_URL = "https://search.worldbank.org/api/v2/wds"
 _QUERY = "artificial intelligence"
 _PAGE_SIZE = 50
 _MAX_RESULTS = 200
 
+# ETags per (query, offset) persist between cron runs; pages the API reports
+# unchanged come back as bodiless 304s and are skipped entirely
+_ETAG_CACHE_PATH = Path(os.getenv("WORLDBANK_ETAG_CACHE", ".worldbank_etags"))
+
+
+def _load_etags() -> dict[str, str]:
+    try:
+        with open(_ETAG_CACHE_PATH) as fh:
+            return json.load(fh)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as exc:
+        logger.warning(f"[worldbank] Could not load ETag cache: {exc}")
+        return {}
+
+
+def _save_etags(etags: dict[str, str]) -> None:
+    try:
+        with open(_ETAG_CACHE_PATH, "w") as fh:
+            json.dump(etags, fh)
+    except OSError as exc:
+        logger.warning(f"[worldbank] Could not persist ETag cache: {exc}")
+
 
 class WorldBankScraper(BaseScraper):
     source_name = "worldbank"
 
+    # ETags observed during run(); persisted via _on_batch_committed only
+    # after the batch reaches the database
+    _pending_etags: dict[str, str] | None = None
+
     def run(self) -> list[dict]:
         items: list[dict] = []
-        offset = 0
-
-        while offset < _MAX_RESULTS:
-            params = {
-                "qterm": _QUERY,
-                "format": "json",
-                "rows": _PAGE_SIZE,
-                "os": offset,
-            }
+
+        # The result window is capped at _MAX_RESULTS, so every page offset is
+        # known up front — issue them all concurrently over one shared client.
+        offsets = range(0, _MAX_RESULTS, _PAGE_SIZE)
+        etags = _load_etags()
+
+        def _cache_key(offset: int) -> str:
+            return f"{_QUERY}|{offset}"
+
+        async def _gather() -> list:
+            async with new_async_client() as client:
+                sem = asyncio.Semaphore(MAX_CONCURRENCY)
+                return await asyncio.gather(
+                    *(
+                        fetch(
+                            client,
+                            sem,
+                            _API_URL,
+                            params={
+                                "qterm": _QUERY,
+                                "format": "json",
+                                "rows": _PAGE_SIZE,
+                                "os": offset,
+                            },
+                            headers=(
+                                {"If-None-Match": etags[_cache_key(offset)]}
+                                if _cache_key(offset) in etags
+                                else None
+                            ),
+                        )
+                        for offset in offsets
+                    )
+                )
+
+        for offset, response in zip(offsets, asyncio.run(_gather())):
+            if response is None:
+                continue
+            if response.status_code == 304:
+                logger.info(f"[worldbank] Offset {offset} unchanged (304), skipped")
+                continue
+            etag = response.headers.get("etag")
+            if etag:
+                etags[_cache_key(offset)] = etag
             try:
-                response = httpx.get(_API_URL, params=params, timeout=30, follow_redirects=True)
-                response.raise_for_status()
-                data = response.json()
-            except Exception as exc:
-                logger.error(f"[worldbank] Error fetching page at offset {offset}: {exc}")
-                break
+                data = json_loads(response.content)
+            except ValueError as exc:
+                logger.error(f"[worldbank] Bad JSON at offset {offset}: {exc}")
+                continue
 
             documents = data.get("documents", {})
             if not documents:
-                logger.info(f"[worldbank] No more documents at offset {offset}")
-                break
+                logger.info(f"[worldbank] No documents at offset {offset}")
+                continue
 
             page_items = []
             for doc_id, doc in documents.items():
@@ -54,30 +116,28 @@ class WorldBankScraper(BaseScraper):
                 if item:
                     page_items.append(item)
 
-            if not page_items:
-                break
-
             items.extend(page_items)
             logger.info(f"[worldbank] Fetched {len(page_items)} documents at offset {offset}")
-            offset += _PAGE_SIZE
-
-        # Deduplicate within batch
-        seen: set[str] = set()
-        unique_items = []
-        for item in items:
-            url = item["source_url"]
-            if url not in seen:
-                seen.add(url)
-                unique_items.append(item)
-
-        new_items = self._filter_existing(unique_items)
+
+        # Hold the updated ETags until the batch commits: persisting them now
+        # would turn a failed save into permanent 304 skips for documents
+        # that were fetched but never stored
+        self._pending_etags = etags
+
+        # Single sweep drops in-batch duplicates and URLs already in the DB
+        new_items = self._filter_existing(items)
         logger.info(
-            f"[worldbank] {len(unique_items)} fetched, "
-            f"{len(unique_items) - len(new_items)} already in DB, "
+            f"[worldbank] {len(items)} fetched, "
+            f"{len(items) - len(new_items)} duplicate or already in DB, "
             f"{len(new_items)} new"
         )
         return new_items
 
+    def _on_batch_committed(self) -> None:
+        if self._pending_etags is not None:
+            _save_etags(self._pending_etags)
+            self._pending_etags = None
+
     def _parse_document(self, doc: dict) -> dict | None:
         url = (doc.get("url") or "").strip()
         if not url:
@@ -95,12 +155,14 @@ class WorldBankScraper(BaseScraper):
         scraped_at = datetime.utcnow()
         raw_date = doc.get("docdt") or ""
         if raw_date:
-            for fmt in ("%Y-%m-%dT%H:%M:%SZ", "%Y-%m-%d"):
-                try:
-                    scraped_at = datetime.strptime(raw_date[:19] if "T" in raw_date else raw_date[:10], fmt)
-                    break
-                except ValueError:
-                    continue
+            # fromisoformat (C-accelerated) covers both the timestamp and
+            # date-only shapes the API returns; slicing drops the trailing Z
+            try:
+                scraped_at = datetime.fromisoformat(
+                    raw_date[:19] if "T" in raw_date else raw_date[:10]
+                )
+            except ValueError:
+                pass
 
         return {
             "title": title,
@@ -110,23 +172,3 @@ class WorldBankScraper(BaseScraper):
             "scraped_at": scraped_at,
         }
 
-    def _filter_existing(self, items: list[dict]) -> list[dict]:
-        if not items:
-            return []
-
-        urls = [item["source_url"] for item in items]
-        db = SessionLocal()
-        try:
-            existing = {
-                row.source_url
-                for row in db.query(RawDocument.source_url)
-                .filter(RawDocument.source_url.in_(urls))
-                .all()
-            }
-        except Exception as exc:
-            logger.error(f"[worldbank] DB lookup error during deduplication: {exc}")
-            existing = set()
-        finally:
-            db.close()
-
-        return [item for item in items if item["source_url"] not in existing]
@@ -0,0 +1,56 @@
+"""Shared scraper utilities."""
+
+import sys
+
+from bs4 import BeautifulSoup
+from loguru import logger
+
+try:
+    from selectolax.parser import HTMLParser as _SelectolaxParser
+except ImportError:
+    _SelectolaxParser = None
+
+try:
+    from lxml import html as _lxml_html
+except ImportError:  # pragma: no cover - lxml ships with scrapy installs
+    _lxml_html = None
+
+try:
+    # orjson parses straight from bytes in C, several times faster than the
+    # stdlib on the multi-hundred-KB API payloads the scrapers pull.
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads  # noqa: F401
+
+
+def configure_async_logging() -> None:
+    """Route loguru through an enqueued, background-thread sink.
+
+    Formatting and I/O then happen off the calling thread, so logging in the
+    scrape hot paths doesn't stall DB commits or fetch loops. Call once from
+    an entrypoint before scrapers start.
+    """
+    logger.remove()
+    logger.add(sys.stderr, enqueue=True)
+
+
+def html_to_text(html: str) -> str:
+    """Extract whitespace-normalized plain text from an HTML fragment.
+
+    Prefers selectolax's Modest engine (~10x faster than the pure-Python
+    html.parser on extraction), then lxml, then BeautifulSoup — whichever is
+    available first and doesn't choke on the markup.
+    """
+    if _SelectolaxParser is not None:
+        try:
+            text = _SelectolaxParser(html).text(separator=" ", strip=True)
+            return " ".join(text.split())
+        except Exception:
+            pass
+    if _lxml_html is not None:
+        try:
+            text = " ".join(_lxml_html.fromstring(html).itertext())
+            return " ".join(text.split())
+        except Exception:
+            pass
+    return BeautifulSoup(html, "html.parser").get_text(separator=" ", strip=True)
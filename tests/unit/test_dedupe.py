@@ -0,0 +1,37 @@
+"""Unit tests for content-digest duplicate suppression."""
+
+from src.scraper.dedupe import ContentDigestFilter, content_digest
+
+
+def test_content_digest_normalizes_formatting():
+    a = content_digest("Hello, World! Published 2024-06-10.")
+    b = content_digest("hello   world published")
+    assert a == b
+
+
+def test_content_digest_differs_for_different_text():
+    assert content_digest("alpha") != content_digest("beta")
+
+
+def test_filter_membership_only_after_update(tmp_path):
+    flt = ContentDigestFilter.load(tmp_path / "digests")
+    digest = content_digest("some article body")
+    assert digest not in flt
+    flt.update([digest])
+    assert digest in flt
+
+
+def test_shared_filter_is_one_instance():
+    assert ContentDigestFilter.shared() is ContentDigestFilter.shared()
+
+
+def test_filter_persists_between_loads(tmp_path):
+    path = tmp_path / "digests"
+    digest = content_digest("some article body")
+
+    flt = ContentDigestFilter.load(path)
+    flt.update([digest])
+    flt.save()
+
+    reloaded = ContentDigestFilter.load(path)
+    assert digest in reloaded
@@ -1,4 +1,4 @@
-from src.scraper.models import Base, RawDocument, ScrapeRun
+from src.scraper.models import Base, RawDocument, ScrapeRun, uuid7
 
 
 def test_models_importable():
@@ -19,3 +19,11 @@ def test_scrape_run_columns():
 def test_base_has_both_tables():
     assert "raw_documents" in Base.metadata.tables
     assert "scrape_runs" in Base.metadata.tables
+
+
+def test_uuid7_is_version_7_and_time_ordered():
+    ids = [uuid7() for _ in range(100)]
+    assert all(u.version == 7 for u in ids)
+    # Timestamp prefix must be non-decreasing within a single run
+    timestamps = [u.int >> 80 for u in ids]
+    assert timestamps == sorted(timestamps)
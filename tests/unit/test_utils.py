@@ -0,0 +1,13 @@
+from src.scraper.utils import html_to_text
+
+
+def test_html_to_text_strips_tags():
+    assert html_to_text("<p>Hello <b>world</b></p>") == "Hello world"
+
+
+def test_html_to_text_separates_blocks():
+    assert html_to_text("<div><p>first</p><p>second</p></div>") == "first second"
+
+
+def test_html_to_text_normalizes_whitespace():
+    assert html_to_text("<p>  spaced\n\n  out  </p>") == "spaced out"